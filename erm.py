@@ -331,7 +331,7 @@ class Bot(commands.AutoShardedBot):
             asyncio.create_task(start_webgui_async(bot, webgui_host, webgui_port))
         except Exception as e:
             logging.warning(f"Failed to start WebGUI Dashboard: {e}")
-            logging.warning("Install requirements: pip install psutil uvicorn fastapi")
+            logging.warning("Install requirements: pip install psutil uvicorn fastapi orjson")
         
         logging.info("All tasks are now running!")
 
@@ -0,0 +1,71 @@
+import unittest
+from datetime import timedelta
+
+from webgui.server import _accepts_gzip, _diff_stats, _format_uptime
+
+
+class DiffStatsTests(unittest.TestCase):
+    """Tests the WebSocket delta computation in `webgui.server`."""
+
+    def test_unchanged_stats_give_empty_delta(self):
+        """`_diff_stats` returns an empty delta when nothing changed."""
+        stats = {"system": {"cpu": {"percent": 5.0}}, "bot": {"guild_count": 3}}
+        self.assertEqual(_diff_stats(stats, stats), {})
+
+    def test_changed_top_level_value(self):
+        """`_diff_stats` includes top-level values that changed."""
+        self.assertEqual(_diff_stats({"a": 1, "b": 2}, {"a": 1, "b": 3}), {"b": 3})
+
+    def test_changed_nested_value(self):
+        """`_diff_stats` recurses into nested dicts and only keeps changed leaves."""
+        old = {"system": {"cpu": {"percent": 5.0, "count_logical": 4}, "timestamp": "t1"}}
+        new = {"system": {"cpu": {"percent": 7.5, "count_logical": 4}, "timestamp": "t1"}}
+        self.assertEqual(_diff_stats(old, new), {"system": {"cpu": {"percent": 7.5}}})
+
+    def test_value_changed_to_none(self):
+        """`_diff_stats` reports a value changing to `None` like any other change."""
+        self.assertEqual(_diff_stats({"a": 1}, {"a": None}), {"a": None})
+
+    def test_removed_nested_key_requires_full_update(self):
+        """`_diff_stats` returns `None` when a nested key was removed."""
+        self.assertIsNone(_diff_stats({"a": 1, "b": {"c": 1, "d": 2}}, {"a": 1, "b": {"c": 1}}))
+
+    def test_removed_top_level_key_requires_full_update(self):
+        """`_diff_stats` returns `None` when a top-level key was removed."""
+        self.assertIsNone(_diff_stats({"a": 1, "b": {"c": 1, "d": 2}}, {"b": {"c": 1}}))
+
+    def test_added_key_requires_full_update(self):
+        """`_diff_stats` returns `None` when a key was added, e.g. the error fallback recovering."""
+        old = {"system": {"error": "Internal error", "timestamp": "t1"}}
+        new = {"system": {"cpu": {"percent": 5.0}, "timestamp": "t2"}}
+        self.assertIsNone(_diff_stats(old, new))
+
+    def test_dict_replaced_by_scalar(self):
+        """`_diff_stats` sends the new value when a dict is replaced by a scalar."""
+        self.assertEqual(_diff_stats({"a": {"b": 1}}, {"a": 0}), {"a": 0})
+
+
+class FormatUptimeTests(unittest.TestCase):
+    """Tests the uptime formatting in `webgui.server`."""
+
+    def test_matches_timedelta_str(self):
+        """`_format_uptime` formats seconds exactly like `str(timedelta)`."""
+        for seconds in (0, 59, 86399, 86400, 90061, 10 * 86400):
+            with self.subTest(seconds=seconds):
+                self.assertEqual(_format_uptime(seconds), str(timedelta(seconds=seconds)))
+
+
+class AcceptsGzipTests(unittest.TestCase):
+    """Tests the Accept-Encoding parsing in `webgui.server`."""
+
+    def test_gzip_refused_with_zero_quality(self):
+        """`_accepts_gzip` returns `False` for an explicit `gzip;q=0`."""
+        self.assertFalse(_accepts_gzip("gzip;q=0"))
+
+    def test_explicit_gzip_overrides_refused_wildcard(self):
+        """`_accepts_gzip` returns `True` when gzip is listed even though `*` is refused."""
+        self.assertTrue(_accepts_gzip("*;q=0, gzip"))
+
+    def test_empty_header(self):
+        """`_accepts_gzip` returns `False` when no encodings are accepted."""
+        self.assertFalse(_accepts_gzip(""))
@@ -4,19 +4,20 @@ Provides real-time system monitoring and bot statistics
 """
 
 import asyncio
-import json
+import gzip
 import logging
 import os
 import platform
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
+import orjson
 import psutil
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
-from starlette.websockets import WebSocketState
 
 # Try to import uvicorn, handle if not available
 try:
@@ -24,126 +25,363 @@ try:
 except ImportError:
     uvicorn = None
 
+# Prefer the C httptools parser over the pure-Python h11 default
+try:
+    import httptools  # noqa: F401
+    _HTTP = "httptools"
+except ImportError:
+    _HTTP = "auto"
+
 app = FastAPI(title="ERM-CE Bot Dashboard", version="1.0.0")
 
+# Dashboard page, read (and gzip-compressed) once instead of on every request
+_DASHBOARD_PATH = os.path.join(os.path.dirname(__file__), "dashboard.html")
+
+
+def _load_dashboard() -> Tuple[Optional[bytes], Optional[bytes]]:
+    """Return the dashboard HTML and its gzip-compressed form, or Nones if missing"""
+    try:
+        with open(_DASHBOARD_PATH, "rb") as f:
+            html = f.read()
+    except FileNotFoundError:
+        return None, None
+    return html, gzip.compress(html, 9)
+
+
+_DASHBOARD_HTML, _DASHBOARD_HTML_GZ = _load_dashboard()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q=0 refusals"""
+    qualities = {}
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    # An explicit gzip entry takes precedence over the "*" wildcard
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
 # Store reference to the bot instance
 bot_instance = None
 
+# Byte divisors for the *_gb / *_mb fields; values are sent unrounded and
+# formatted for display by the dashboard
+_GB = 1 << 30
+_MB = 1 << 20
+
+# Process handle for the bot itself, reused so cpu_percent() has a baseline
+_PROC = psutil.Process()
+
+# Host details that do not change for the lifetime of the process
+_CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True)
+_CPU_COUNT_PHYSICAL = psutil.cpu_count(logical=False)
+try:
+    _CPU_FREQ = psutil.cpu_freq()
+    _CPU_FREQ_MAX = _CPU_FREQ.max if _CPU_FREQ else 0
+except Exception as e:
+    # Some platforms/psutil builds raise here; don't let that break the import
+    logging.warning(f"Could not read CPU frequency: {e}")
+    _CPU_FREQ_MAX = 0
+_BOOT_TIME = psutil.boot_time()
+_STATIC_SYSTEM = {
+    "platform": platform.system(),
+    "platform_release": platform.release(),
+    "platform_version": platform.version(),
+    "architecture": platform.machine(),
+    "hostname": platform.node(),
+    "python_version": platform.python_version(),
+    "boot_time": datetime.fromtimestamp(_BOOT_TIME).isoformat(),
+}
+
+# Prime the CPU counters so the first non-blocking read has a delta to work from
+psutil.cpu_percent(interval=None)
+_PROC.cpu_percent(interval=None)
+
+# Latest (system, process) CPU percentages. Non-blocking cpu_percent() reads
+# measure the time since the previous read by any caller, so the counters are
+# re-read at most once per _CPU_SAMPLE_INTERVAL and callers share the sample.
+# Kept just under broadcast_stats' 1s cadence so tick jitter doesn't skip a sample
+_CPU_SAMPLE_INTERVAL = 0.9
+_cpu_sample: Optional[Tuple[float, float]] = None
+_cpu_sample_ts = 0.0
+_cpu_sample_lock = threading.Lock()
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections: Set[WebSocket] = set()
+        # Set while at least one client is connected, so broadcasters can idle
+        self.has_clients = asyncio.Event()
+
+    def connect(self, websocket: WebSocket):
+        """Register an already-accepted WebSocket for broadcasts"""
+        self.active_connections.add(websocket)
+        self.has_clients.set()
         logging.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        if not self.active_connections:
+            self.has_clients.clear()
         logging.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict):
-        """Send message to all connected clients"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                if connection.client_state == WebSocketState.CONNECTED:
-                    await connection.send_json(message)
-                else:
-                    disconnected.append(connection)
-            except Exception as e:
-                logging.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
+    async def broadcast(self, payload: bytes):
+        """Send a pre-serialized payload to all connected clients"""
+        # Snapshot, since clients may (dis)connect while sends are in flight.
+        # Closed sockets raise on send, so no per-client state check is needed
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True
+        )
         
         # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logging.error(f"Error broadcasting to client: {result}")
+                self.disconnect(connection)
 
 manager = ConnectionManager()
 
+# Last stats broadcast to clients; every connected client's view matches this,
+# so each tick only needs to send what changed since it
+_last_stats: Optional[Dict] = None
+# Serialized "initial" message for _last_stats, shared by clients joining
+# between ticks; cleared whenever _last_stats changes
+_initial_payload: Optional[bytes] = None
+
+# Stats collection for a joining client before any broadcast exists. Clients
+# joining while it is in flight, or within _FRESH_STATS_TTL seconds of it
+# starting, await the same task instead of collecting their own
+_FRESH_STATS_TTL = 0.5
+_fresh_stats_task: Optional[asyncio.Task] = None
+_fresh_stats_ts = 0.0
+
+
+def _diff_stats(old: Dict, new: Dict) -> Optional[Dict]:
+    """
+    Return the keys of ``new`` whose values differ from ``old``, recursing into nested dicts.
+
+    Merging a delta can't remove keys, so this returns None when a key was added
+    or removed at any level; callers then send the full stats instead.
+    """
+    if old.keys() != new.keys():
+        return None
+    delta = {}
+    for key, value in new.items():
+        previous = old[key]
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = _diff_stats(previous, value)
+            if nested is None:
+                return None
+            if nested:
+                delta[key] = nested
+        elif previous != value:
+            delta[key] = value
+    return delta
+
+
+# Metrics that change slowly are only re-collected every _SLOW_METRICS_TTL seconds
+_SLOW_METRICS_TTL = 30
+_slow_metrics: Dict[str, Tuple[float, Any]] = {}
+
+
+def _get_slow_metric(key: str, collect: Callable[[], Any]) -> Any:
+    """Return a cached slow-changing metric, refreshing it once it has expired"""
+    now = time.monotonic()
+    cached = _slow_metrics.get(key)
+    if cached is None or now - cached[0] >= _SLOW_METRICS_TTL:
+        cached = (now, collect())
+        _slow_metrics[key] = cached
+    return cached[1]
+
+
+def _collect_disk_info() -> Dict:
+    disk = psutil.disk_usage('/')
+    return {
+        "total_gb": disk.total / _GB,
+        "used_gb": disk.used / _GB,
+        "free_gb": disk.free / _GB,
+        "percent": disk.percent,
+    }
+
+
+# Guild/user totals, seeded from the bot's cache once and then kept up to date
+# by gateway event listeners (see _register_count_listeners)
+_guild_count_cache: Optional[int] = None
+_user_count_cache: Optional[int] = None
+# Bot the count listeners have been attached to, so they are only added once
+_count_listeners_bot = None
+
+
+def _get_bot_counts() -> Tuple[int, int]:
+    global _guild_count_cache, _user_count_cache
+    if _guild_count_cache is None or _user_count_cache is None:
+        guilds = bot_instance.guilds
+        _guild_count_cache = len(guilds)
+        _user_count_cache = sum(guild.member_count or 0 for guild in guilds)
+    return _guild_count_cache, _user_count_cache
+
+
+async def _reset_bot_counts():
+    global _guild_count_cache, _user_count_cache
+    _guild_count_cache = None
+    _user_count_cache = None
+
+
+async def _on_guild_join(guild):
+    global _guild_count_cache, _user_count_cache
+    if _guild_count_cache is not None:
+        _guild_count_cache += 1
+        _user_count_cache += guild.member_count or 0
+
+
+async def _on_guild_remove(guild):
+    global _guild_count_cache, _user_count_cache
+    if _guild_count_cache is not None:
+        _guild_count_cache -= 1
+        _user_count_cache -= guild.member_count or 0
+
+
+async def _on_member_join(member):
+    global _user_count_cache
+    if _user_count_cache is not None:
+        _user_count_cache += 1
+
+
+async def _on_member_remove(member):
+    global _user_count_cache
+    if _user_count_cache is not None:
+        _user_count_cache -= 1
+
+
+def _register_count_listeners(bot):
+    """Attach the listeners that keep the guild/user count caches current"""
+    global _guild_count_cache, _user_count_cache, _count_listeners_bot
+    _guild_count_cache = None
+    _user_count_cache = None
+    if _count_listeners_bot is bot:
+        return
+    bot.add_listener(_reset_bot_counts, "on_ready")
+    bot.add_listener(_on_guild_join, "on_guild_join")
+    bot.add_listener(_on_guild_remove, "on_guild_remove")
+    bot.add_listener(_on_member_join, "on_member_join")
+    bot.add_listener(_on_member_remove, "on_member_remove")
+    _count_listeners_bot = bot
+
+
+# ISO timestamp for the current second, rebuilt only when the second changes
+_timestamp_second = -1
+_timestamp_iso = ""
+
+
+def _timestamp() -> str:
+    """Return the current local time as an ISO string with whole-second precision"""
+    global _timestamp_second, _timestamp_iso
+    now = int(time.time())
+    if now != _timestamp_second:
+        _timestamp_iso = datetime.fromtimestamp(now).isoformat()
+        _timestamp_second = now
+    return _timestamp_iso
+
+
+def _format_uptime(seconds: int) -> str:
+    """Format whole seconds like str(timedelta), e.g. 2 days, 3:04:05"""
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    clock = f"{hours}:{minutes:02d}:{secs:02d}"
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {clock}"
+    return clock
+
+
+def _get_cpu_percents() -> Tuple[float, float]:
+    """Return (system, process) CPU usage, re-sampling at most once per _CPU_SAMPLE_INTERVAL"""
+    global _cpu_sample, _cpu_sample_ts
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        if _cpu_sample is None or now - _cpu_sample_ts >= _CPU_SAMPLE_INTERVAL:
+            _cpu_sample = (psutil.cpu_percent(interval=None), _PROC.cpu_percent(interval=None))
+            _cpu_sample_ts = now
+        return _cpu_sample
+
 
 def get_system_info() -> Dict:
     """Get comprehensive system information"""
     try:
         # CPU Information
-        cpu_percent = psutil.cpu_percent(interval=0.1, percpu=False)
-        cpu_count = psutil.cpu_count(logical=True)
-        cpu_count_physical = psutil.cpu_count(logical=False)
+        cpu_percent, process_cpu = _get_cpu_percents()
         cpu_freq = psutil.cpu_freq()
         
         # Memory Information
         memory = psutil.virtual_memory()
         swap = psutil.swap_memory()
         
-        # Disk Information
-        disk = psutil.disk_usage('/')
+        # Disk Information (slow-changing, refreshed periodically)
+        disk_info = _get_slow_metric("disk", _collect_disk_info)
         
         # Network Information
         net_io = psutil.net_io_counters()
         
-        # Process Information
-        process = psutil.Process(os.getpid())
-        process_memory = process.memory_info()
-        process_cpu = process.cpu_percent(interval=0.1)
+        # Process Information (batched into a single /proc read)
+        process = _PROC
+        with process.oneshot():
+            process_memory = process.memory_info()
+            process_threads = process.num_threads()
         
         # System Information
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
-        uptime = datetime.now() - boot_time
+        uptime_seconds = int(time.time() - _BOOT_TIME)
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "cpu": {
-                "percent": round(cpu_percent, 2),
-                "count_logical": cpu_count,
-                "count_physical": cpu_count_physical,
-                "frequency_mhz": round(cpu_freq.current, 2) if cpu_freq else 0,
-                "frequency_max_mhz": round(cpu_freq.max, 2) if cpu_freq else 0,
+                "percent": cpu_percent,
+                "count_logical": _CPU_COUNT_LOGICAL,
+                "count_physical": _CPU_COUNT_PHYSICAL,
+                "frequency_mhz": cpu_freq.current if cpu_freq else 0,
+                "frequency_max_mhz": _CPU_FREQ_MAX,
             },
             "memory": {
-                "total_gb": round(memory.total / (1024**3), 2),
-                "available_gb": round(memory.available / (1024**3), 2),
-                "used_gb": round(memory.used / (1024**3), 2),
-                "percent": round(memory.percent, 2),
-                "swap_total_gb": round(swap.total / (1024**3), 2),
-                "swap_used_gb": round(swap.used / (1024**3), 2),
-                "swap_percent": round(swap.percent, 2),
-            },
-            "disk": {
-                "total_gb": round(disk.total / (1024**3), 2),
-                "used_gb": round(disk.used / (1024**3), 2),
-                "free_gb": round(disk.free / (1024**3), 2),
-                "percent": round(disk.percent, 2),
+                "total_gb": memory.total / _GB,
+                "available_gb": memory.available / _GB,
+                "used_gb": memory.used / _GB,
+                "percent": memory.percent,
+                "swap_total_gb": swap.total / _GB,
+                "swap_used_gb": swap.used / _GB,
+                "swap_percent": swap.percent,
             },
+            "disk": disk_info,
             "network": {
-                "bytes_sent_mb": round(net_io.bytes_sent / (1024**2), 2),
-                "bytes_recv_mb": round(net_io.bytes_recv / (1024**2), 2),
+                "bytes_sent_mb": net_io.bytes_sent / _MB,
+                "bytes_recv_mb": net_io.bytes_recv / _MB,
                 "packets_sent": net_io.packets_sent,
                 "packets_recv": net_io.packets_recv,
             },
             "process": {
-                "memory_mb": round(process_memory.rss / (1024**2), 2),
-                "cpu_percent": round(process_cpu, 2),
-                "threads": process.num_threads(),
+                "memory_mb": process_memory.rss / _MB,
+                "cpu_percent": process_cpu,
+                "threads": process_threads,
             },
             "system": {
-                "platform": platform.system(),
-                "platform_release": platform.release(),
-                "platform_version": platform.version(),
-                "architecture": platform.machine(),
-                "hostname": platform.node(),
-                "python_version": platform.python_version(),
-                "boot_time": boot_time.isoformat(),
-                "uptime_seconds": int(uptime.total_seconds()),
-                "uptime_human": str(uptime).split('.')[0],  # Remove microseconds
+                **_STATIC_SYSTEM,
+                "uptime_seconds": uptime_seconds,
+                "uptime_human": _format_uptime(uptime_seconds),
             }
         }
     except Exception as e:
         logging.error(f"Error getting system info: {e}")
         return {
             "error": "Internal error while collecting system information",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _timestamp()
         }
 
 
@@ -157,13 +395,14 @@ def get_bot_info() -> Dict:
     
     try:
         bot_uptime = time.time() - bot_instance.start_time if hasattr(bot_instance, 'start_time') else 0
+        guild_count, user_count = _get_bot_counts()
         
         return {
             "status": "online" if bot_instance.is_ready() else "starting",
             "bot_name": str(bot_instance.user) if bot_instance.user else "Unknown",
             "bot_id": bot_instance.user.id if bot_instance.user else 0,
-            "guild_count": len(bot_instance.guilds),
-            "user_count": sum(guild.member_count for guild in bot_instance.guilds),
+            "guild_count": guild_count,
+            "user_count": user_count,
             "uptime_seconds": int(bot_uptime),
             "uptime_human": f"{int(bot_uptime // 3600)}h {int((bot_uptime % 3600) // 60)}m {int(bot_uptime % 60)}s",
             "latency_ms": round(bot_instance.latency * 1000, 2) if bot_instance.latency else 0,
@@ -179,64 +418,103 @@ def get_bot_info() -> Dict:
 
 
 @app.get("/")
-async def get_dashboard():
+async def get_dashboard(request: Request):
     """Serve the dashboard HTML"""
-    html_file = os.path.join(os.path.dirname(__file__), "dashboard.html")
-    try:
-        with open(html_file, "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    if _DASHBOARD_HTML is None:
         return HTMLResponse(
             content="<h1>Dashboard not found</h1><p>Please ensure dashboard.html is in the webgui directory.</p>",
             status_code=404
         )
 
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return HTMLResponse(
+            content=_DASHBOARD_HTML_GZ,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return HTMLResponse(content=_DASHBOARD_HTML, headers={"Vary": "Accept-Encoding"})
+
+
+def _json_response(data: Dict) -> Response:
+    """Encode a JSON response body with orjson"""
+    return Response(content=orjson.dumps(data), media_type="application/json")
+
 
 @app.get("/api/system")
 async def get_system_stats():
     """Get current system statistics"""
-    return get_system_info()
+    return _json_response(await asyncio.to_thread(get_system_info))
 
 
 @app.get("/api/bot")
 async def get_bot_stats():
     """Get current bot statistics"""
-    return get_bot_info()
+    return _json_response(get_bot_info())
 
 
 @app.get("/api/combined")
 async def get_combined_stats():
     """Get both system and bot statistics"""
+    return _json_response({
+        "system": await asyncio.to_thread(get_system_info),
+        "bot": get_bot_info()
+    })
+
+
+async def _collect_stats() -> Dict:
     return {
-        "system": get_system_info(),
+        "system": await asyncio.to_thread(get_system_info),
         "bot": get_bot_info()
     }
 
 
+async def _get_fresh_stats() -> Dict:
+    """Return stats for a joining client, sharing one collection between concurrent joiners"""
+    global _fresh_stats_task, _fresh_stats_ts
+    task = _fresh_stats_task
+    if (
+        task is None
+        or time.monotonic() - _fresh_stats_ts >= _FRESH_STATS_TTL
+        or (task.done() and (task.cancelled() or task.exception() is not None))
+    ):
+        task = asyncio.create_task(_collect_stats())
+        _fresh_stats_task, _fresh_stats_ts = task, time.monotonic()
+    # Shielded so one joiner disconnecting doesn't cancel the others' collection
+    return await asyncio.shield(task)
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
-    await manager.connect(websocket)
+    global _last_stats, _initial_payload
+    await websocket.accept()
     
     try:
+        # The initial snapshot must be the state later deltas are diffed
+        # against, so reuse the last broadcast when there is one
+        if _last_stats is None:
+            fresh = await _get_fresh_stats()
+
+        # A broadcast may have gone out while collecting; if not, the first
+        # joiner's snapshot becomes the baseline for the broadcaster's deltas
+        if _last_stats is None:
+            _last_stats = fresh
+            _initial_payload = None
+        if _initial_payload is None:
+            _initial_payload = orjson.dumps({"type": "initial", **_last_stats})
+        payload = _initial_payload
+
+        # No awaits between picking the snapshot and registering, so no delta
+        # can be missed
+        manager.connect(websocket)
+
         # Send initial data immediately
-        await websocket.send_json({
-            "type": "initial",
-            "system": get_system_info(),
-            "bot": get_bot_info()
-        })
+        await websocket.send_bytes(payload)
         
-        # Keep connection alive and wait for client messages
+        # Keep connection alive; updates are pushed by broadcast_stats, so
+        # this simply suspends until the client sends something or disconnects
         while True:
-            try:
-                # Wait for client messages (can be used for commands later)
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=1.0)
-                # Process client commands here if needed
-            except asyncio.TimeoutError:
-                # No message received, continue
-                pass
-            
-            await asyncio.sleep(0.1)  # Small delay to prevent tight loop
+            data = await websocket.receive_text()
+            # Process client commands here if needed
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -247,22 +525,43 @@ async def websocket_endpoint(websocket: WebSocket):
 
 async def broadcast_stats():
     """Background task to broadcast system stats to all connected clients"""
+    global _last_stats, _initial_payload
     while True:
+        if not manager.active_connections:
+            # Nobody holds the last snapshot any more
+            _last_stats = None
+            _initial_payload = None
+            # Idle without waking until a client connects
+            await manager.has_clients.wait()
+            # The joiner was just sent a fresh snapshot, so resume on the
+            # normal cadence instead of re-collecting immediately
+            await asyncio.sleep(1)
+            continue
+
         try:
             if manager.active_connections:
                 stats = {
-                    "type": "update",
-                    "system": get_system_info(),
+                    # psutil reads /proc, so keep it off the event loop thread
+                    "system": await asyncio.to_thread(get_system_info),
                     "bot": get_bot_info()
                 }
-                await manager.broadcast(stats)
+                delta = None if _last_stats is None else _diff_stats(_last_stats, stats)
+                if delta is None:
+                    message = {"type": "update", **stats}
+                else:
+                    message = {"type": "delta", **delta}
+                _last_stats = stats
+                _initial_payload = None
+                # Serialize once per tick, regardless of client count
+                if len(message) > 1:
+                    await manager.broadcast(orjson.dumps(message))
         except Exception as e:
             logging.error(f"Error broadcasting stats: {e}")
         
         await asyncio.sleep(1)  # Update every second
 
 
-def start_webgui(bot, host: str = "0.0.0.0", port: int = 8080):
+def start_webgui(bot, host: str = "0.0.0.0", port: int = 8080, log_level: str = "warning"):
     """
     Start the web GUI server
     
@@ -270,6 +569,8 @@ def start_webgui(bot, host: str = "0.0.0.0", port: int = 8080):
         bot: The Discord bot instance
         host: Host to bind to (default: 0.0.0.0 for all interfaces)
         port: Port to listen on (default: 8080)
+        log_level: uvicorn log level (default: warning). Access logging is
+            off, since the dashboard polls the server continuously
     """
     global bot_instance
     bot_instance = bot
@@ -278,6 +579,8 @@ def start_webgui(bot, host: str = "0.0.0.0", port: int = 8080):
         logging.error("uvicorn not installed. Cannot start WebGUI. Install with: pip install uvicorn")
         return
     
+    _register_count_listeners(bot)
+    
     logging.info(f"Starting WebGUI on http://{host}:{port}")
     
     # Start the background task for broadcasting stats
@@ -288,15 +591,16 @@ def start_webgui(bot, host: str = "0.0.0.0", port: int = 8080):
         app=app,
         host=host,
         port=port,
-        log_level="info",
-        access_log=True
+        http=_HTTP,
+        log_level=log_level,
+        access_log=False
     )
     server = uvicorn.Server(config)
     
     return server
 
 
-async def start_webgui_async(bot, host: str = "0.0.0.0", port: int = 8080):
+async def start_webgui_async(bot, host: str = "0.0.0.0", port: int = 8080, log_level: str = "warning"):
     """
     Start the web GUI server asynchronously
     """
@@ -307,6 +611,8 @@ async def start_webgui_async(bot, host: str = "0.0.0.0", port: int = 8080):
         logging.error("uvicorn not installed. Cannot start WebGUI.")
         return
     
+    _register_count_listeners(bot)
+    
     logging.info(f"Starting WebGUI on http://{host}:{port}")
     
     # Start the background task
@@ -317,8 +623,9 @@ async def start_webgui_async(bot, host: str = "0.0.0.0", port: int = 8080):
         app=app,
         host=host,
         port=port,
-        log_level="info",
-        access_log=True
+        http=_HTTP,
+        log_level=log_level,
+        access_log=False
     )
     server = uvicorn.Server(config)
     await server.serve()
@@ -327,4 +634,4 @@ async def start_webgui_async(bot, host: str = "0.0.0.0", port: int = 8080):
 if __name__ == "__main__":
     # For testing without bot
     logging.basicConfig(level=logging.INFO)
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(app, host="0.0.0.0", port=8080, http=_HTTP)